@@ -3,7 +3,7 @@ try:
 except ImportError:
     from itertools import izip_longest as zip_longest
 import collections
-import os
+import math
 from copy import deepcopy
 from fontParts.base.errors import FontPartsError
 from fontParts.base.base import (
@@ -48,8 +48,9 @@ class BaseGlyph(BaseObject,
         contents = [
             "'%s'" % self.name,
         ]
-        if self.layer is not None:
-            contents.append("('%s')" % self.layer.name)
+        layer = self.layer
+        if layer is not None:
+            contents.append("('%s')" % layer.name)
         return contents
 
     def copy(self):
@@ -208,7 +209,8 @@ class BaseGlyph(BaseObject,
         return value
 
     def _set_base_unicodes(self, value):
-        value = list(value)
+        if not isinstance(value, (list, tuple)):
+            value = list(value)
         value = normalizers.normalizeGlyphUnicodes(value)
         self._set_unicodes(value)
 
@@ -278,7 +280,7 @@ class BaseGlyph(BaseObject,
 
         Subclasses may override this method.
         """
-        values = self.unicodes
+        values = self._get_unicodes()
         if values:
             return values[0]
         return None
@@ -399,6 +401,8 @@ class BaseGlyph(BaseObject,
         Subclasses may override this method.
         """
         diff = value - self.leftMargin
+        if not diff:
+            return
         self.moveBy((diff, 0))
         self.width += diff
 
@@ -534,6 +538,8 @@ class BaseGlyph(BaseObject,
         Subclasses may override this method.
         """
         diff = value - self.bottomMargin
+        if not diff:
+            return
         self.moveBy((0, diff))
         self.height += diff
 
@@ -727,17 +733,18 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        other = other.copy()
-        if offset != (0, 0):
-            other.moveBy(offset)
+        ox, oy = offset
         for contour in other.contours:
-            self.appendContour(contour)
+            self.appendContour(contour, offset=offset)
         for component in other.components:
-            self.appendComponent(component=component)
+            x, y = component.offset
+            self.appendComponent(component=component, offset=(x + ox, y + oy))
         for anchor in other.anchors:
-            self.appendAnchor(anchor=anchor)
+            x, y = anchor.position
+            self.appendAnchor(anchor=anchor, position=(x + ox, y + oy))
         for guideline in other.guidelines:
-            self.appendGuideline(guideline=guideline)
+            x, y = guideline.position
+            self.appendGuideline(guideline=guideline, position=(x + ox, y + oy))
 
     # Contours
 
@@ -760,7 +767,12 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        return tuple([self[i] for i in range(len(self))])
+        contours = []
+        for index in range(self._lenContours()):
+            contour = self._getContour(index)
+            self._setGlyphInContour(contour)
+            contours.append(contour)
+        return tuple(contours)
 
     def __len__(self):
         """
@@ -794,12 +806,10 @@ class BaseGlyph(BaseObject,
 
         Subclasses may override this method.
         """
-        count = len(self)
-        index = 0
-        while count:
-            yield self[index]
-            count -= 1
-            index += 1
+        for index in range(self._lenContours()):
+            contour = self._getContour(index)
+            self._setGlyphInContour(contour)
+            yield contour
 
     def __getitem__(self, index):
         """
@@ -910,8 +920,8 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        for _ in range(len(self)):
-            self.removeContour(-1)
+        for index in reversed(range(self._lenContours())):
+            self._removeContour(index)
 
     def removeOverlap(self):
         """
@@ -950,8 +960,12 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        return tuple([self._getitem__components(i) for
-                     i in range(self._len__components())])
+        components = []
+        for index in range(self._len__components()):
+            component = self._getComponent(index)
+            self._setGlyphInComponent(component)
+            components.append(component)
+        return tuple(components)
 
     def _len__components(self):
         return self._lenComponents()
@@ -1030,7 +1044,7 @@ class BaseGlyph(BaseObject,
             if baseGlyph is None:
                 baseGlyph = component.baseGlyph
             if component.identifier is not None:
-                existing = set([c.identifier for c in self.components if c.identifier is not None])
+                existing = {c.identifier for c in self.components}
                 if component.identifier not in existing:
                     identifier = component.identifier
         baseGlyph = normalizers.normalizeGlyphName(baseGlyph)
@@ -1103,8 +1117,8 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        for _ in range(self._len__components()):
-            self.removeComponent(-1)
+        for index in reversed(range(self._len__components())):
+            self._removeComponent(index)
 
     def decompose(self):
         """
@@ -1142,8 +1156,12 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        return tuple([self._getitem__anchors(i) for
-                     i in range(self._len__anchors())])
+        anchors = []
+        for index in range(self._len__anchors()):
+            anchor = self._getAnchor(index)
+            self._setGlyphInAnchor(anchor)
+            anchors.append(anchor)
+        return tuple(anchors)
 
     def _len__anchors(self):
         return self._lenAnchors()
@@ -1213,7 +1231,7 @@ class BaseGlyph(BaseObject,
             if color is None:
                 color = anchor.color
             if anchor.identifier is not None:
-                existing = set([a.identifier for a in self.anchors if a.identifier is not None])
+                existing = {a.identifier for a in self.anchors}
                 if anchor.identifier not in existing:
                     identifier = anchor.identifier
         name = normalizers.normalizeAnchorName(name)
@@ -1274,8 +1292,8 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        for _ in range(self._len__anchors()):
-            self.removeAnchor(-1)
+        for index in reversed(range(self._len__anchors())):
+            self._removeAnchor(index)
 
     # ----------
     # Guidelines
@@ -1300,8 +1318,12 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        return tuple([self._getitem__guidelines(i) for
-                     i in range(self._len__guidelines())])
+        guidelines = []
+        for index in range(self._len__guidelines()):
+            guideline = self._getGuideline(index)
+            self._setGlyphInGuideline(guideline)
+            guidelines.append(guideline)
+        return tuple(guidelines)
 
     def _len__guidelines(self):
         return self._lenGuidelines()
@@ -1378,7 +1400,7 @@ class BaseGlyph(BaseObject,
             if color is None:
                 color = guideline.color
             if guideline.identifier is not None:
-                existing = set([g.identifier for g in self.guidelines if g.identifier is not None])
+                existing = {g.identifier for g in self.guidelines}
                 if guideline.identifier not in existing:
                     identifier = guideline.identifier
         position = normalizers.normalizeCoordinateTuple(position)
@@ -1444,8 +1466,8 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        for _ in range(self._len__guidelines()):
-            self.removeGuideline(-1)
+        for index in reversed(range(self._len__guidelines())):
+            self._removeGuideline(index)
 
     # ------------------
     # Data Normalization
@@ -1528,8 +1550,8 @@ class BaseGlyph(BaseObject,
         """
         tempContourList = []
         contourList = []
-        xThreshold = None
-        yThreshold = None
+        xThreshold = math.inf
+        yThreshold = math.inf
 
         for contour in self:
             bounds = contour.bounds
@@ -1542,9 +1564,9 @@ class BaseGlyph(BaseObject,
             yC = 0.5 * (yMin + yMax)
             xTh = abs(width * 0.5)
             yTh = abs(height * 0.5)
-            if xThreshold is None or xThreshold > xTh:
+            if xTh < xThreshold:
                 xThreshold = xTh
-            if yThreshold is None or yThreshold > yTh:
+            if yTh < yThreshold:
                 yThreshold = yTh
             tempContourList.append((-len(contour.points), -len(contour.segments), xC, yC, -(width * height), contour))
 
@@ -1564,6 +1586,8 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
+        if matrix == (1, 0, 0, 1, 0, 0):
+            return
         for contour in self.contours:
             contour.transformBy(matrix)
         for component in self.components:
@@ -1638,17 +1662,18 @@ class BaseGlyph(BaseObject,
         )
         pen = mathGlyph.getPointPen()
         self.drawPoints(pen)
-        for anchor in self.anchors:
-            d = dict(
+        mathGlyph.anchors = [
+            dict(
                 x=anchor.x,
                 y=anchor.y,
                 name=anchor.name,
                 identifier=anchor.identifier,
                 color=anchor.color
             )
-            mathGlyph.anchors.append(d)
-        for guideline in self.guidelines:
-            d = dict(
+            for anchor in self.anchors
+        ]
+        mathGlyph.guidelines = [
+            dict(
                 x=guideline.x,
                 y=guideline.y,
                 angle=guideline.angle,
@@ -1656,7 +1681,8 @@ class BaseGlyph(BaseObject,
                 identifier=guideline.identifier,
                 color=guideline.color
             )
-            mathGlyph.guidelines.append(d)
+            for guideline in self.guidelines
+        ]
         mathGlyph.lib = deepcopy(self.lib)
         mathGlyph.name = self.name
         mathGlyph.unicodes = self.unicodes
@@ -1867,7 +1893,7 @@ class BaseGlyph(BaseObject,
         glyph1 = self
         glyph2 = other
         # contour count
-        if len(self.contours) != len(glyph2.contours):
+        if len(glyph1) != len(glyph2):
             reporter.fatal = True
             reporter.contourCountDifference = True
         # contour pairs
@@ -1876,13 +1902,15 @@ class BaseGlyph(BaseObject,
             contour2 = glyph2[i]
             self._checkPairs(contour1, contour2, reporter, reporter.contours)
         # component count
-        if len(glyph1.components) != len(glyph2.components):
+        components1 = glyph1.components
+        components2 = glyph2.components
+        if len(components1) != len(components2):
             reporter.fatal = True
             reporter.componentCountDifference = True
         # component check
         component_diff = []
-        selfComponents = [component.baseGlyph for component in glyph1.components]
-        otherComponents = [component.baseGlyph for component in glyph2.components]
+        selfComponents = [component.baseGlyph for component in components1]
+        otherComponents = [component.baseGlyph for component in components2]
         for index, (left, right) in enumerate(
             zip_longest(selfComponents, otherComponents)
         ):
@@ -1916,34 +1944,38 @@ class BaseGlyph(BaseObject,
                     missing_from_glyph2.elements()
                 )
         # guideline count
-        if len(self.guidelines) != len(glyph2.guidelines):
+        guidelines1 = glyph1.guidelines
+        guidelines2 = glyph2.guidelines
+        if len(guidelines1) != len(guidelines2):
             reporter.warning = True
             reporter.guidelineCountDifference = True
         # guideline check
         selfGuidelines = []
         otherGuidelines = []
-        for source, names in ((self, selfGuidelines),
-                              (other, otherGuidelines)):
-            for i, guideline in enumerate(source.guidelines):
+        for source, names in ((guidelines1, selfGuidelines),
+                              (guidelines2, otherGuidelines)):
+            for i, guideline in enumerate(source):
                 names.append((guideline.name, i))
-        guidelines1 = set(selfGuidelines)
-        guidelines2 = set(otherGuidelines)
-        if len(guidelines1.difference(guidelines2)) != 0:
+        guidelineSet1 = set(selfGuidelines)
+        guidelineSet2 = set(otherGuidelines)
+        if len(guidelineSet1.difference(guidelineSet2)) != 0:
             reporter.warning = True
             reporter.guidelinesMissingFromGlyph2 = list(
-                guidelines1.difference(guidelines2))
-        if len(guidelines2.difference(guidelines1)) != 0:
+                guidelineSet1.difference(guidelineSet2))
+        if len(guidelineSet2.difference(guidelineSet1)) != 0:
             reporter.warning = True
             reporter.guidelinesMissingFromGlyph1 = list(
-                guidelines2.difference(guidelines1))
+                guidelineSet2.difference(guidelineSet1))
         # anchor count
-        if len(self.anchors) != len(glyph2.anchors):
+        anchors1 = glyph1.anchors
+        anchors2 = glyph2.anchors
+        if len(anchors1) != len(anchors2):
             reporter.warning = True
             reporter.anchorCountDifference = True
         # anchor check
         anchor_diff = []
-        selfAnchors = [anchor.name for anchor in glyph1.anchors]
-        otherAnchors = [anchor.name for anchor in glyph2.anchors]
+        selfAnchors = [anchor.name for anchor in anchors1]
+        otherAnchors = [anchor.name for anchor in anchors2]
         for index, (left, right) in enumerate(zip_longest(selfAnchors, otherAnchors)):
             if left != right:
                 anchor_diff.append((index, left, right))
@@ -2066,10 +2098,11 @@ class BaseGlyph(BaseObject,
         font = self.font
         if font is None:
             return tuple()
+        name = self.name
         glyphs = []
         for layer in font.layers:
-            if self.name in layer:
-                glyphs.append(layer[self.name])
+            if name in layer:
+                glyphs.append(layer[name])
         return tuple(glyphs)
 
     # get
@@ -2091,9 +2124,11 @@ class BaseGlyph(BaseObject,
 
         Subclasses may override this method.
         """
-        for glyph in self.layers:
-            if glyph.layer.name == name:
-                return glyph
+        font = self.font
+        if font is not None and name in font.layerOrder:
+            layer = font.getLayer(name)
+            if self.name in layer:
+                return layer[self.name]
         raise ValueError("No layer named '%s' in glyph '%s'."
                          % (name, self.name))
 
@@ -2112,11 +2147,11 @@ class BaseGlyph(BaseObject,
         layerName = name
         glyphName = self.name
         layerName = normalizers.normalizeLayerName(layerName)
-        for glyph in self.layers:
-            if glyph.layer.name == layerName:
-                layer = glyph.layer
+        font = self.font
+        if font is not None and layerName in font.layerOrder:
+            layer = font.getLayer(layerName)
+            if glyphName in layer:
                 layer.removeGlyph(glyphName)
-                break
         glyph = self._newLayer(name=layerName)
         layer = self.font.getLayer(layerName)
         # layer._setLayerInGlyph(glyph)
@@ -2149,8 +2184,9 @@ class BaseGlyph(BaseObject,
             layer = layer.layer.name
         layerName = layer
         layerName = normalizers.normalizeLayerName(layerName)
-        if self._getLayer(layerName).layer.name == layerName:
-            self._removeLayer(layerName)
+        # raises a ValueError if the glyph is not in the layer
+        self._getLayer(layerName)
+        self._removeLayer(layerName)
 
     def _removeLayer(self, name, **kwargs):
         """
@@ -2231,11 +2267,11 @@ class BaseGlyph(BaseObject,
         ox, oy = position
         transformation = (sx, 0, 0, sy, ox, oy)
         if path is not None:
-            if not os.path.exists(path):
-                raise IOError("No image located at '%s'." % path)
-            f = open(path, "rb")
-            data = f.read()
-            f.close()
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                raise IOError("No image located at '%s'." % path) from None
         self._addImage(data=data, transformation=transformation, color=color)
         return self.image
 
@@ -2465,6 +2501,40 @@ class BaseGlyph(BaseObject,
     # Selection
     # ---------
 
+    def _normalizeSelectedSubObjects(self, value, normalizer, count,
+                                     typeName):
+        """
+        Normalize a sequence of sub-objects and/or sub-object
+        indexes. Objects are normalized with **normalizer**.
+        Indexes must be valid for **count** sub-objects and
+        negative indexes are converted to positive ones.
+        A ``bool`` is not treated as an index. **typeName**
+        is used in the error raised for an invalid index.
+        """
+        normalized = []
+        for i in value:
+            if isinstance(i, int) and not isinstance(i, bool):
+                if not -count <= i < count:
+                    raise ValueError("No %s located at index %d."
+                                     % (typeName, i))
+                i %= count
+            else:
+                i = normalizer(i)
+            normalized.append(i)
+        return normalized
+
+    def _setSelectedSubObjectsOrIndexes(self, subObjects, value):
+        """
+        Select the sub-objects in **subObjects** given in **value**,
+        which may contain sub-objects and/or valid, positive indexes.
+        """
+        selected = set()
+        for i in value:
+            if isinstance(i, int):
+                i = subObjects[i]
+            selected.add(i)
+        self._setSelectedSubObjects(subObjects, selected)
+
     # contours
 
     selectedContours = dynamicProperty(
@@ -2483,8 +2553,8 @@ class BaseGlyph(BaseObject,
     )
 
     def _get_base_selectedContours(self):
-        selected = tuple([normalizers.normalizeContour(contour) for
-                         contour in self._get_selectedContours()])
+        selected = tuple(map(normalizers.normalizeContour,
+                             self._get_selectedContours()))
         return selected
 
     def _get_selectedContours(self):
@@ -2494,20 +2564,16 @@ class BaseGlyph(BaseObject,
         return self._getSelectedSubObjects(self.contours)
 
     def _set_base_selectedContours(self, value):
-        normalized = []
-        for i in value:
-            if isinstance(i, int):
-                i = normalizers.normalizeIndex(i)
-            else:
-                i = normalizers.normalizeContour(i)
-            normalized.append(i)
+        normalized = self._normalizeSelectedSubObjects(
+            value, normalizers.normalizeContour, self._lenContours(),
+            "contour")
         self._set_selectedContours(normalized)
 
     def _set_selectedContours(self, value):
         """
         Subclasses may override this method.
         """
-        return self._setSelectedSubObjects(self.contours, value)
+        return self._setSelectedSubObjectsOrIndexes(self.contours, value)
 
     # components
 
@@ -2527,8 +2593,8 @@ class BaseGlyph(BaseObject,
     )
 
     def _get_base_selectedComponents(self):
-        selected = tuple([normalizers.normalizeComponent(component) for
-                         component in self._get_selectedComponents()])
+        selected = tuple(map(normalizers.normalizeComponent,
+                             self._get_selectedComponents()))
         return selected
 
     def _get_selectedComponents(self):
@@ -2538,20 +2604,16 @@ class BaseGlyph(BaseObject,
         return self._getSelectedSubObjects(self.components)
 
     def _set_base_selectedComponents(self, value):
-        normalized = []
-        for i in value:
-            if isinstance(i, int):
-                i = normalizers.normalizeIndex(i)
-            else:
-                i = normalizers.normalizeComponent(i)
-            normalized.append(i)
+        normalized = self._normalizeSelectedSubObjects(
+            value, normalizers.normalizeComponent, self._len__components(),
+            "component")
         self._set_selectedComponents(normalized)
 
     def _set_selectedComponents(self, value):
         """
         Subclasses may override this method.
         """
-        return self._setSelectedSubObjects(self.components, value)
+        return self._setSelectedSubObjectsOrIndexes(self.components, value)
 
     # anchors
 
@@ -2571,8 +2633,8 @@ class BaseGlyph(BaseObject,
     )
 
     def _get_base_selectedAnchors(self):
-        selected = tuple([normalizers.normalizeAnchor(anchor) for
-                         anchor in self._get_selectedAnchors()])
+        selected = tuple(map(normalizers.normalizeAnchor,
+                             self._get_selectedAnchors()))
         return selected
 
     def _get_selectedAnchors(self):
@@ -2582,20 +2644,16 @@ class BaseGlyph(BaseObject,
         return self._getSelectedSubObjects(self.anchors)
 
     def _set_base_selectedAnchors(self, value):
-        normalized = []
-        for i in value:
-            if isinstance(i, int):
-                i = normalizers.normalizeIndex(i)
-            else:
-                i = normalizers.normalizeAnchor(i)
-            normalized.append(i)
+        normalized = self._normalizeSelectedSubObjects(
+            value, normalizers.normalizeAnchor, self._len__anchors(),
+            "anchor")
         self._set_selectedAnchors(normalized)
 
     def _set_selectedAnchors(self, value):
         """
         Subclasses may override this method.
         """
-        return self._setSelectedSubObjects(self.anchors, value)
+        return self._setSelectedSubObjectsOrIndexes(self.anchors, value)
 
     # guidelines
 
@@ -2615,8 +2673,8 @@ class BaseGlyph(BaseObject,
     )
 
     def _get_base_selectedGuidelines(self):
-        selected = tuple([normalizers.normalizeGuideline(guideline) for
-                         guideline in self._get_selectedGuidelines()])
+        selected = tuple(map(normalizers.normalizeGuideline,
+                             self._get_selectedGuidelines()))
         return selected
 
     def _get_selectedGuidelines(self):
@@ -2626,17 +2684,13 @@ class BaseGlyph(BaseObject,
         return self._getSelectedSubObjects(self.guidelines)
 
     def _set_base_selectedGuidelines(self, value):
-        normalized = []
-        for i in value:
-            if isinstance(i, int):
-                i = normalizers.normalizeIndex(i)
-            else:
-                i = normalizers.normalizeGuideline(i)
-            normalized.append(i)
+        normalized = self._normalizeSelectedSubObjects(
+            value, normalizers.normalizeGuideline, self._len__guidelines(),
+            "guideline")
         self._set_selectedGuidelines(normalized)
 
     def _set_selectedGuidelines(self, value):
         """
         Subclasses may override this method.
         """
-        return self._setSelectedSubObjects(self.guidelines, value)
+        return self._setSelectedSubObjectsOrIndexes(self.guidelines, value)
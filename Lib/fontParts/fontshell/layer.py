@@ -60,6 +60,9 @@ class RLayer(RBaseObject, BaseLayer):
     def _keys(self, **kwargs):
         return self.naked().keys()
 
+    def _contains(self, name, **kwargs):
+        return name in self.naked()
+
     def _newGlyph(self, name, **kwargs):
         layer = self.naked()
         layer.newGlyph(name)
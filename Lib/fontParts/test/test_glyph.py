@@ -1,5 +1,8 @@
 import unittest
 import collections
+import tempfile
+import os
+import shutil
 from fontParts.base import FontPartsError
 from .test_image import testImageData
 
@@ -290,6 +293,14 @@ class TestGlyph(unittest.TestCase):
             # No layer named 'layer_name' in glyph 'B'
             glyph.getLayer('layer_name')
 
+    def test_getLayer_valid_glyph_not_in_layer(self):
+        font = self.get_generic_object("font")
+        font.newLayer("background")
+        glyph = font.newGlyph("B")
+        with self.assertRaises(ValueError):
+            # No layer named 'background' in glyph 'B'
+            glyph.getLayer('background')
+
     def test_getLayer_invalid(self):
         font = self.get_generic_object("font")
         glyph = font.newGlyph("B")
@@ -398,6 +409,38 @@ class TestGlyph(unittest.TestCase):
         self.assertEqual(len(glyph_one.anchors), 6)
         self.assertEqual(len(glyph_one.guidelines), 6)
 
+    def test_appendGlyph_offset(self):
+        glyph_one = self.get_generic_object("glyph")
+        glyph_two = self.getGlyph_generic()
+        glyph_two.appendComponent("component 1", offset=(10, 20),
+                                  scale=(2, 3))
+        glyph_one.appendGlyph(glyph_two, (300, -40))
+        self.assertEqual(
+            [(point.x, point.y) for point in glyph_one[0].points],
+            [(400, -50), (400, 60), (500, 60), (500, -40)]
+        )
+        self.assertEqual(
+            glyph_one.components[0].transformation,
+            (2, 0, 0, 3, 310, -20)
+        )
+        self.assertEqual(
+            [anchor.position for anchor in glyph_one.anchors],
+            [(301, -38), (303, -36)]
+        )
+        self.assertEqual(
+            [guideline.position for guideline in glyph_one.guidelines],
+            [(301, -38), (303, -36)]
+        )
+        self.assertEqual(
+            [guideline.angle for guideline in glyph_one.guidelines],
+            [0, 90]
+        )
+        self.assertEqual(len(glyph_two), 2)
+        self.assertEqual(
+            [(point.x, point.y) for point in glyph_two[0].points],
+            [(100, -10), (100, 100), (200, 100), (200, 0)]
+        )
+
     # --------
     # Contours
     # --------
@@ -794,6 +837,29 @@ class TestGlyph(unittest.TestCase):
             testImageData
         )
 
+    def test_addImage_path(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        path = os.path.join(root, "image.png")
+        with open(path, "wb") as f:
+            f.write(testImageData)
+        font = self.get_generic_object("font")
+        glyph = font.newGlyph("glyphWithImage")
+        image = glyph.addImage(path=path)
+        self.assertEqual(
+            image.data,
+            testImageData
+        )
+
+    def test_addImage_path_not_found(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        path = os.path.join(root, "image.png")
+        font = self.get_generic_object("font")
+        glyph = font.newGlyph("glyphWithImage")
+        with self.assertRaisesRegex(IOError, "No image located at"):
+            glyph.addImage(path=path)
+
     # ----
     # Hash
     # ----
@@ -967,6 +1033,41 @@ class TestGlyph(unittest.TestCase):
             ()
         )
 
+    def test_selectedContours_setBool(self):
+        glyph = self.getGlyph_generic()
+        contour1 = glyph.contours[0]
+        try:
+            contour1.selected = False
+        except NotImplementedError:
+            return
+        with self.assertRaises(TypeError):
+            glyph.selectedContours = [True]
+
+    def test_selectedContours_setIndexes(self):
+        glyph = self.getGlyph_generic()
+        contour1 = glyph.contours[0]
+        contour2 = glyph.contours[1]
+        try:
+            contour1.selected = True
+        except NotImplementedError:
+            return
+        glyph.selectedContours = [-1]
+        self.assertEqual(
+            glyph.selectedContours,
+            (contour2,)
+        )
+
+    def test_selectedContours_setIndexOutOfRange(self):
+        glyph = self.getGlyph_generic()
+        contour1 = glyph.contours[0]
+        try:
+            contour1.selected = False
+        except NotImplementedError:
+            return
+        with self.assertRaisesRegex(ValueError,
+                                    "No contour located at index 2."):
+            glyph.selectedContours = [2]
+
     # Components
     def test_selectedComponents_default(self):
         glyph = self.getGlyph_generic()
@@ -1027,6 +1128,35 @@ class TestGlyph(unittest.TestCase):
             ()
         )
 
+    def test_selectedComponents_setIndexes(self):
+        glyph = self.getGlyph_generic()
+        glyph.appendComponent("component 1")
+        glyph.appendComponent("component 2")
+        component1 = glyph.components[0]
+        component2 = glyph.components[1]
+        try:
+            component1.selected = True
+        except NotImplementedError:
+            return
+        glyph.selectedComponents = [-1]
+        self.assertEqual(
+            glyph.selectedComponents,
+            (component2,)
+        )
+
+    def test_selectedComponents_setIndexOutOfRange(self):
+        glyph = self.getGlyph_generic()
+        glyph.appendComponent("component 1")
+        glyph.appendComponent("component 2")
+        component1 = glyph.components[0]
+        try:
+            component1.selected = False
+        except NotImplementedError:
+            return
+        with self.assertRaisesRegex(ValueError,
+                                    "No component located at index 2."):
+            glyph.selectedComponents = [2]
+
     # Anchors
 
     def test_selectedAnchors_default(self):
@@ -1082,6 +1212,31 @@ class TestGlyph(unittest.TestCase):
             ()
         )
 
+    def test_selectedAnchors_setIndexes(self):
+        glyph = self.getGlyph_generic()
+        anchor1 = glyph.anchors[0]
+        anchor2 = glyph.anchors[1]
+        try:
+            anchor1.selected = True
+        except NotImplementedError:
+            return
+        glyph.selectedAnchors = [-1]
+        self.assertEqual(
+            glyph.selectedAnchors,
+            (anchor2,)
+        )
+
+    def test_selectedAnchors_setIndexOutOfRange(self):
+        glyph = self.getGlyph_generic()
+        anchor1 = glyph.anchors[0]
+        try:
+            anchor1.selected = False
+        except NotImplementedError:
+            return
+        with self.assertRaisesRegex(ValueError,
+                                    "No anchor located at index 2."):
+            glyph.selectedAnchors = [2]
+
     # Guidelines
 
     def test_selectedGuidelines_default(self):
@@ -1137,6 +1292,31 @@ class TestGlyph(unittest.TestCase):
             ()
         )
 
+    def test_selectedGuidelines_setIndexes(self):
+        glyph = self.getGlyph_generic()
+        guideline1 = glyph.guidelines[0]
+        guideline2 = glyph.guidelines[1]
+        try:
+            guideline1.selected = True
+        except NotImplementedError:
+            return
+        glyph.selectedGuidelines = [-1]
+        self.assertEqual(
+            glyph.selectedGuidelines,
+            (guideline2,)
+        )
+
+    def test_selectedGuidelines_setIndexOutOfRange(self):
+        glyph = self.getGlyph_generic()
+        guideline1 = glyph.guidelines[0]
+        try:
+            guideline1.selected = False
+        except NotImplementedError:
+            return
+        with self.assertRaisesRegex(ValueError,
+                                    "No guideline located at index 2."):
+            glyph.selectedGuidelines = [2]
+
     # -------------
     # Compatibility
     # -------------